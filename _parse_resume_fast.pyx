@@ -0,0 +1,110 @@
+# cython: language_level=3
+"""Cython-accelerated resume parser.
+
+Optional drop-in for the pure-Python parser in app.py: same algorithm,
+with C-typed locals to cut interpreter dispatch in the per-line loop.
+Built on demand through pyximport when Cython and a C compiler are
+available; app.py falls back to the pure parser otherwise.
+
+Keep the keyword table and classification rules in sync with app.py.
+"""
+
+import re
+from bisect import bisect_right
+
+_SECTION_KEYWORDS = {
+    'contact': ('email', 'phone', 'linkedin', 'github', '@'),
+    'summary': ('summary', 'objective', 'about'),
+    'experience': ('experience', 'work history', 'employment'),
+    'education': ('education', 'academic'),
+    'skills': ('skills', 'technical skills', 'competencies'),
+    'projects': ('projects', 'personal projects'),
+}
+_KEYWORD_TO_SECTION = {keyword: section
+                       for section, keywords in _SECTION_KEYWORDS.items()
+                       for keyword in keywords}
+_SECTION_RE = re.compile(
+    '(%s)' % '|'.join(map(re.escape, _KEYWORD_TO_SECTION)),
+    re.IGNORECASE
+)
+
+
+cdef dict _scan_header_hits(str text, list lines):
+    cdef Py_ssize_t offset = 0
+    cdef Py_ssize_t index
+    cdef str line
+    cdef list line_starts = []
+    cdef dict hits = {}
+    for line in lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+    for match in _SECTION_RE.finditer(text):
+        index = bisect_right(line_starts, match.start()) - 1
+        if index not in hits:
+            hits[index] = match.group(1).lower()
+    return hits
+
+
+cpdef dict parse_resume_text_fast(str text):
+    """Parse the input text into resume sections (C-compiled loop)."""
+    cdef dict sections = {
+        'name': '',
+        'contact': '',
+        'summary': '',
+        'experience': [],
+        'education': [],
+        'skills': [],
+        'projects': []
+    }
+    cdef Py_ssize_t i, n
+    cdef str line, keyword, section, cleaned
+    cdef str current_section = None
+    cdef list current_item = []
+    cdef list contact_parts = []
+    cdef list summary_parts = []
+
+    text = text.strip()
+    cdef list lines = text.split('\n')
+    cdef dict header_hits = _scan_header_hits(text, lines)
+    n = len(lines)
+
+    if lines:
+        sections['name'] = lines[0].strip()
+
+    for i in range(1, n):
+        line = lines[i].strip()
+        if not line:
+            continue
+
+        keyword = header_hits.get(i)
+        if keyword is not None:
+            section = _KEYWORD_TO_SECTION[keyword]
+            if section == 'contact':
+                if current_section == 'contact':
+                    contact_parts.append(line)
+                else:
+                    contact_parts = [line]
+                    current_section = 'contact'
+            else:
+                current_section = section
+        else:
+            if current_section == 'summary':
+                summary_parts.append(line)
+            elif current_section in ('experience', 'education', 'projects'):
+                if line and (line[0].isupper() or line[0].isdigit()):
+                    if current_item:
+                        sections[current_section].append('<br/>'.join(current_item))
+                        current_item = []
+                current_item.append(line)
+            elif current_section == 'skills':
+                cleaned = line.strip('•-').strip()
+                if cleaned:
+                    sections['skills'].append(cleaned)
+
+    if current_item and current_section in ('experience', 'education', 'projects'):
+        sections[current_section].append('<br/>'.join(current_item))
+
+    sections['contact'] = ' | '.join(contact_parts)
+    sections['summary'] = ' '.join(summary_parts)
+
+    return sections
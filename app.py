@@ -1,15 +1,59 @@
 import streamlit as st
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
-from reportlab.lib import colors
-from io import BytesIO
+import logging
 import re
+import tempfile
+from bisect import bisect_right
 
-def parse_resume_text(text):
-    """Parse the input text into resume sections"""
+# ReportLab's text measurement and encoding run ~30% faster with its C
+# extensions (the optional rl-accel package); install with
+# `pip install reportlab[accel]` rather than the pure-Python wheel
+try:
+    import _rl_accel  # noqa: F401
+except ImportError:
+    logging.getLogger(__name__).info(
+        "rl-accel C extensions not installed; PDF generation will use "
+        "ReportLab's pure-Python code paths"
+    )
+
+# Single source of truth for section detection; the reverse lookup and
+# the compiled alternation (one C-level scan over the text) derive from it
+_SECTION_KEYWORDS = {
+    'contact': ('email', 'phone', 'linkedin', 'github', '@'),
+    'summary': ('summary', 'objective', 'about'),
+    'experience': ('experience', 'work history', 'employment'),
+    'education': ('education', 'academic'),
+    'skills': ('skills', 'technical skills', 'competencies'),
+    'projects': ('projects', 'personal projects'),
+}
+_KEYWORD_TO_SECTION = {keyword: section
+                       for section, keywords in _SECTION_KEYWORDS.items()
+                       for keyword in keywords}
+_SECTION_RE = re.compile(
+    '(%s)' % '|'.join(map(re.escape, _KEYWORD_TO_SECTION)),
+    re.IGNORECASE
+)
+
+def _scan_header_hits(text, lines):
+    """Locate section-keyword hits per line in one pass over the text.
+
+    Runs the compiled alternation once over the whole buffer instead of
+    once per line, then maps each match offset back to its line index.
+    Returns {line_index: first matched keyword, lowercased}.
+    """
+    line_starts = []
+    offset = 0
+    for line in lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+    hits = {}
+    for match in _SECTION_RE.finditer(text):
+        index = bisect_right(line_starts, match.start()) - 1
+        hits.setdefault(index, match.group(1).lower())
+    return hits
+
+def _parse_resume_py(text):
+    """Pure-Python resume parser; see _parse_resume_fast.pyx for the
+    optional Cython build of the same loop"""
     sections = {
         'name': '',
         'contact': '',
@@ -20,9 +64,13 @@ def parse_resume_text(text):
         'projects': []
     }
     
-    lines = text.strip().split('\n')
+    text = text.strip()
+    lines = text.split('\n')
+    header_hits = _scan_header_hits(text, lines)
     current_section = None
     current_item = []
+    contact_parts = []
+    summary_parts = []
     
     # First line is usually the name
     if lines:
@@ -33,55 +81,67 @@ def parse_resume_text(text):
         if not line:
             continue
             
-        # Detect section headers
-        lower_line = line.lower()
-        if any(keyword in lower_line for keyword in ['email', 'phone', 'linkedin', 'github', '@']):
-            if current_section == 'contact':
-                sections['contact'] += ' | ' + line
+        # Detect section headers from the pre-scan
+        keyword = header_hits.get(i)
+        if keyword is not None:
+            section = _KEYWORD_TO_SECTION[keyword]
+            if section == 'contact':
+                if current_section == 'contact':
+                    contact_parts.append(line)
+                else:
+                    contact_parts = [line]
+                    current_section = 'contact'
             else:
-                sections['contact'] = line
-                current_section = 'contact'
-        elif any(keyword in lower_line for keyword in ['summary', 'objective', 'about']):
-            current_section = 'summary'
-        elif any(keyword in lower_line for keyword in ['experience', 'work history', 'employment']):
-            current_section = 'experience'
-        elif any(keyword in lower_line for keyword in ['education', 'academic']):
-            current_section = 'education'
-        elif any(keyword in lower_line for keyword in ['skills', 'technical skills', 'competencies']):
-            current_section = 'skills'
-        elif any(keyword in lower_line for keyword in ['projects', 'personal projects']):
-            current_section = 'projects'
+                current_section = section
         else:
             # Add content to current section
             if current_section == 'summary':
-                sections['summary'] += ' ' + line
+                summary_parts.append(line)
             elif current_section in ['experience', 'education', 'projects']:
                 # Check if it's a new item (job title, degree, etc.)
-                if line and (line[0].isupper() or re.match(r'^\d', line)):
+                if line and (line[0].isupper() or line[0].isdigit()):
                     if current_item:
-                        sections[current_section].append('\n'.join(current_item))
+                        sections[current_section].append('<br/>'.join(current_item))
                         current_item = []
                 current_item.append(line)
             elif current_section == 'skills':
-                sections['skills'].append(line)
+                cleaned = line.strip('•-').strip()
+                if cleaned:
+                    sections['skills'].append(cleaned)
     
     # Add last item
     if current_item and current_section in ['experience', 'education', 'projects']:
-        sections[current_section].append('\n'.join(current_item))
-    
+        sections[current_section].append('<br/>'.join(current_item))
+
+    sections['contact'] = ' | '.join(contact_parts)
+    sections['summary'] = ' '.join(summary_parts)
+
     return sections
 
-def create_resume_pdf(sections):
-    """Generate ATS-friendly PDF from parsed sections"""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter,
-                           topMargin=0.5*inch, bottomMargin=0.5*inch,
-                           leftMargin=0.75*inch, rightMargin=0.75*inch)
-    
-    story = []
+# Optional Cython build of the parsing loop; compiled on demand when
+# Cython and a C compiler are present, otherwise the pure-Python
+# implementation above is used
+try:
+    import pyximport
+    pyximport.install(language_level=3)
+    from _parse_resume_fast import parse_resume_text_fast as _parse_impl
+except ImportError:
+    _parse_impl = _parse_resume_py
+
+@st.cache_data(show_spinner=False)
+def parse_resume_text(text):
+    """Parse the input text into resume sections"""
+    return _parse_impl(text)
+
+@st.cache_resource
+def _get_styles():
+    """Build the custom ATS-friendly ParagraphStyles once per process"""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
     styles = getSampleStyleSheet()
-    
-    # Custom styles for ATS compatibility
+
     title_style = ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
@@ -123,50 +183,77 @@ def create_resume_pdf(sections):
         spaceAfter=6,
         leading=14
     )
-    
-    # Add name
+
+    return title_style, contact_style, heading_style, body_style
+
+def create_resume_pdf(sections):
+    """Generate ATS-friendly PDF from parsed sections"""
+    # Imported here so reruns that never generate a PDF (e.g. while the
+    # user is still typing) don't pay ReportLab's import cost; repeat
+    # clicks hit sys.modules and are free
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph
+
+    # Forward-only writer: stays in memory for typical one-page resumes
+    # and spills to disk instead of growing the buffer for large ones.
+    # The spool threshold is estimated from the content so ordinary
+    # resumes never pay the rollover copy to disk.
+    estimated_size = 8192 + 1024 * (len(sections['experience']) + len(sections['education'])
+                                    + len(sections['skills']) + len(sections['projects']))
+    buffer = tempfile.SpooledTemporaryFile(max_size=max(64 * 1024, estimated_size))
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                           topMargin=0.5*inch, bottomMargin=0.5*inch,
+                           leftMargin=0.75*inch, rightMargin=0.75*inch,
+                           pageCompression=1)
+
+    title_style, contact_style, heading_style, body_style = _get_styles()
+
+    # Every flowable is a Paragraph (entry spacing is baked into the
+    # styles), so collect (text, style) pairs and build the story in one
+    # pass of known size
+    parts = []
+
+    # Name and contact info
     if sections['name']:
-        story.append(Paragraph(sections['name'], title_style))
-    
-    # Add contact info
+        parts.append((sections['name'], title_style))
     if sections['contact']:
-        story.append(Paragraph(sections['contact'], contact_style))
-    
-    # Add summary
+        parts.append((sections['contact'], contact_style))
+
+    # Summary
     if sections['summary']:
-        story.append(Paragraph('<b>PROFESSIONAL SUMMARY</b>', heading_style))
-        story.append(Paragraph(sections['summary'].strip(), body_style))
-    
-    # Add experience
+        parts.append(('<b>PROFESSIONAL SUMMARY</b>', heading_style))
+        parts.append((sections['summary'].strip(), body_style))
+
+    # Experience
     if sections['experience']:
-        story.append(Paragraph('<b>WORK EXPERIENCE</b>', heading_style))
-        for exp in sections['experience']:
-            story.append(Paragraph(exp.replace('\n', '<br/>'), body_style))
-            story.append(Spacer(1, 6))
-    
-    # Add education
+        parts.append(('<b>WORK EXPERIENCE</b>', heading_style))
+        parts.append(('<br/><br/>'.join(sections['experience']), body_style))
+
+    # Education
     if sections['education']:
-        story.append(Paragraph('<b>EDUCATION</b>', heading_style))
-        for edu in sections['education']:
-            story.append(Paragraph(edu.replace('\n', '<br/>'), body_style))
-            story.append(Spacer(1, 6))
-    
-    # Add skills
+        parts.append(('<b>EDUCATION</b>', heading_style))
+        parts.append(('<br/><br/>'.join(sections['education']), body_style))
+
+    # Skills
     if sections['skills']:
-        story.append(Paragraph('<b>SKILLS</b>', heading_style))
-        skills_text = ' • '.join([s.strip('•-').strip() for s in sections['skills'] if s.strip()])
-        story.append(Paragraph(skills_text, body_style))
-    
-    # Add projects
+        parts.append(('<b>SKILLS</b>', heading_style))
+        parts.append((' • '.join(sections['skills']), body_style))
+
+    # Projects
     if sections['projects']:
-        story.append(Paragraph('<b>PROJECTS</b>', heading_style))
-        for proj in sections['projects']:
-            story.append(Paragraph(proj.replace('\n', '<br/>'), body_style))
-            story.append(Spacer(1, 6))
-    
+        parts.append(('<b>PROJECTS</b>', heading_style))
+        parts.append(('<br/><br/>'.join(sections['projects']), body_style))
+
+    story = [Paragraph(text, style) for text, style in parts]
     doc.build(story)
+
+    # st.download_button only accepts str/bytes/io streams, not the
+    # SpooledTemporaryFile wrapper, so read the finished PDF back out
     buffer.seek(0)
-    return buffer
+    pdf_bytes = buffer.read()
+    buffer.close()
+    return pdf_bytes
 
 # Streamlit App
 st.set_page_config(page_title="ATS Resume Generator", page_icon="📄")